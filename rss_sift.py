@@ -0,0 +1,635 @@
+import json
+import argparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
+import replicate
+import os
+import pytz
+import logging
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from bs4 import BeautifulSoup, SoupStrainer
+from feedgen.feed import FeedGenerator
+from flask import Flask, Response, request, render_template, redirect, url_for
+from apscheduler.executors.pool import ThreadPoolExecutor as SchedulerThreadPoolExecutor
+from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import create_engine, event, func, inspect, text, Column, Index, Integer, String, Text, DateTime, Boolean
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import QueuePool
+from croniter import croniter
+from diskcache import Cache
+from waitress import serve
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(name)s - %(message)s',
+    handlers=[
+        logging.FileHandler("app.log"),
+        logging.StreamHandler()
+    ]
+)
+
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+app = Flask(__name__)
+Base = declarative_base()
+
+# Define the SQLite database model
+class FeedData(Base):
+    __tablename__ = 'feed_data'
+    id = Column(Integer, primary_key=True)
+    feed_name = Column(String)
+    title = Column(String)
+    link = Column(String)
+    additional_info = Column(Text)
+    hash = Column(String, unique=True, index=True)
+    skip_ai = Column(Boolean, default=False)
+    created = Column(DateTime)
+
+    # Serves the RSS query (feed_name, skip_ai, newest first) as an index range scan, no sort
+    __table_args__ = (Index('ix_feed_skip_created', 'feed_name', 'skip_ai', 'created'),)
+
+class FeedMeta(Base):
+    __tablename__ = 'feed_meta'
+    id = Column(Integer, primary_key=True)
+    feed_name = Column(String, unique=True)
+    last_fetched = Column(DateTime)
+    etag = Column(String)
+    last_modified = Column(String)
+
+
+# Load configuration
+with open('config.json') as config_file:
+    config = json.load(config_file)
+
+# Setup the SQLite database, one pooled connection per fetch worker
+engine = create_engine(
+    'sqlite:///feeds.db',
+    poolclass=QueuePool,
+    pool_size=config.get('fetch_workers', 4),
+    max_overflow=20,
+    pool_pre_ping=True,
+    # Wait for locks held by the other process instead of failing right away
+    connect_args={'check_same_thread': False, 'timeout': 30}
+)
+
+@event.listens_for(engine, 'connect')
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-65536')  # 64 MB
+    cursor.execute('PRAGMA mmap_size=268435456')  # 256 MB
+    cursor.close()
+
+# The web and scheduler processes start at the same time on a shared database: run the schema
+# setup in an exclusive transaction, so the second one waits and then finds everything in place.
+# SQLite DDL is transactional, a failure leaves the schema untouched
+with engine.connect() as connection:
+    connection.exec_driver_sql('BEGIN EXCLUSIVE')
+    Base.metadata.create_all(connection)
+
+    # create_all doesn't alter existing tables, add columns and indexes introduced after the first release
+    feed_meta_columns = {column['name'] for column in inspect(connection).get_columns('feed_meta')}
+    for column_name in ('etag', 'last_modified'):
+        if column_name not in feed_meta_columns:
+            connection.execute(text(f'ALTER TABLE feed_meta ADD COLUMN {column_name} VARCHAR'))
+    # Only the composite index is new, old databases already index hash through their UNIQUE (hash)
+    for index in FeedData.__table__.indexes:
+        if index.name == 'ix_feed_skip_created':
+            index.create(connection, checkfirst=True)
+    connection.commit()
+# Don't hand the setup connections down to forked gunicorn workers
+engine.dispose()
+
+# One session per thread, shared by Flask requests, scheduler jobs and fetch workers
+Session = scoped_session(sessionmaker(bind=engine))
+
+@app.teardown_appcontext
+def remove_session(exception=None):
+    Session.remove()
+
+# Get the API token from environment variable
+replicate_api_token = os.getenv("REPLICATE_API_TOKEN")
+if not replicate_api_token:
+    raise ValueError("REPLICATE_API_TOKEN environment variable is not set")
+
+
+# Get the timezone from the configuration file
+timezone = pytz.timezone(config.get("timezone", "UTC"))
+
+# Limits shared by the gunicorn workers and the scheduler process, kept in a diskcache directory
+# that every process sees (the app directory is mounted in both containers)
+shared_state = Cache(config.get('shared_state_dir', './.rss_sift_state'))
+
+# Space out AI calls so all workers of all processes together stay under the Replicate rate limit
+ai_min_interval = 60.0 / config.get('ai_requests_per_minute', 60)
+
+def wait_for_ai_slot():
+    with shared_state.transact():
+        now = time.time()
+        next_call = shared_state.get('ai_next_call', 0.0)
+        delay = max(0.0, next_call - now)
+        shared_state.set('ai_next_call', max(now, next_call) + ai_min_interval)
+    if delay:
+        time.sleep(delay)
+
+# Prompts and response patterns used for the AI checks, built once at import time
+AI_MODEL = "meta/meta-llama-3-70b-instruct"
+AI_SYSTEM_PROMPT = "You are an expert and helpful software developer and data expert"
+AI_TOPICS = """        - software development
+        - machine learning
+        - artificial intelligence (AI)
+        - DevOps
+        - programming languages
+        - front-end development
+        - software development best practices
+        - large language models (such as chatgpt, llama)
+        - data science
+        - networking
+        - software architecture
+        - technical leadership"""
+
+TITLE_PROMPT = """Your task is to determine if a book title pertains to one or more of the following topics:
+""" + AI_TOPICS + """
+
+        You should only respond with "yes" or "no". The title must strictly relate to the specified topics and may cover multiple topics listed. 
+        Do not include any additional text, explanations, or comments.
+
+
+        This is the book title: "%s"
+        """
+
+TITLES_PROMPT = """Your task is to determine, for each of the numbered book titles below, if it pertains to one or more of the following topics:
+""" + AI_TOPICS + """
+
+        Respond with exactly one line per title in the form "N: yes" or "N: no", where N is the title number.
+        A title must strictly relate to the specified topics and may cover multiple topics listed.
+        Do not include any additional text, explanations, or comments.
+
+
+        These are the book titles:
+%s
+        """
+
+BATCH_ANSWER_PATTERN = re.compile(r'^\s*(\d+)[:.)]\s*(yes|no)\b', re.I | re.M)
+
+def is_interesting_title(title):
+    try:
+        input = {
+            "prompt": TITLE_PROMPT % title,
+            "system_prompt": AI_SYSTEM_PROMPT}
+
+        wait_for_ai_slot()
+        output = replicate.run(
+            AI_MODEL,
+            input=input
+        )
+
+        # Check if 'yes' or 'no' appears in the response
+        response = ' '.join(output).strip().lower()
+        is_interesting = 'yes' in response
+
+        # Log the response and the result
+        logging.info(f"full AI Response: {output}")
+        logging.info(f"AI Response: {response}")
+        logging.info(f"Parsed to {'True' if is_interesting else 'False'}")
+        
+        return is_interesting
+    except Exception as e:
+        logging.error(f"Error while checking title with AI: {e}")
+        return None
+
+# Classify several titles with a single AI call. Returns None when the
+# response can't be matched to every title, errors from the call are raised.
+def are_interesting_titles(titles):
+    numbered_titles = '\n'.join(f'{i}) "{title}"' for i, title in enumerate(titles, 1))
+    input = {
+        "prompt": TITLES_PROMPT % numbered_titles,
+        "system_prompt": AI_SYSTEM_PROMPT}
+
+    wait_for_ai_slot()
+    output = replicate.run(
+        AI_MODEL,
+        input=input
+    )
+
+    response = ''.join(output).strip()
+    logging.info(f"AI Response: {response}")
+
+    answers = {int(number): answer.lower() == 'yes'
+               for number, answer in BATCH_ANSWER_PATTERN.findall(response)}
+    if set(answers) != set(range(1, len(titles) + 1)):
+        logging.warning(f"AI response does not cover all {len(titles)} titles")
+        return None
+
+    return [answers[i] for i in range(1, len(titles) + 1)]
+
+# Listing markup: div.row > div.article with an h1 title link and a div.text-center info block holding a <b>
+ARTICLE_SELECTOR = 'div.row div.article:has(h1 a.title-link):has(div.text-center b)'
+TITLE_SELECTOR = 'h1 a.title-link'
+INFO_SELECTOR = 'div.text-center:has(b)'
+
+# Publication years in the listing info, e.g. "English | 2024 | ISBN: ...". get_text(strip=True) glues
+# text nodes together ("English2024"), so only neighbouring digits rule a match out, as in an ISBN
+YEAR_PATTERN = re.compile(r'(?<!\d)(?:19|20)\d{2}(?!\d)')
+
+# Cheap local pre-filter: titles that are obviously on or off topic don't need the AI
+ON_TOPIC_PATTERN = re.compile(
+    r'\b(python|golang|rust|kubernetes|docker|devops|llms?|gpt|llama|machine learning|deep learning|'
+    r'data science|microservices?|react|vue|typescript|sre|observability|architect)\b', re.I)
+OFF_TOPIC_PATTERN = re.compile(r'\b(pirates?|romance|cookbook|knitting|memoir|vampires?|wedding)\b', re.I)
+
+def keyword_verdict(title):
+    # Returns True/False when the title is decided by keywords, None when the AI has to check it
+    if OFF_TOPIC_PATTERN.search(title):
+        logging.info(f"Title rejected by keyword filter: {title}")
+        return False
+    if ON_TOPIC_PATTERN.search(title):
+        logging.info(f"Title accepted by keyword filter: {title}")
+        return True
+    return None
+
+# On-disk cache of AI answers, so re-runs and titles listed on several feeds don't hit Replicate again.
+# Keys include the model and topics, a prompt change starts from a clean slate
+ai_cache = Cache(config.get('ai_cache_dir', './.llm_cache'), size_limit=2**30)
+AI_CACHE_EXPIRE = 30 * 86400
+
+# Like the engine: don't hand open cache connections down to forked gunicorn workers, they reopen on use
+shared_state.close()
+ai_cache.close()
+
+def ai_cache_key(title):
+    normalized_title = ' '.join(title.split()).lower()
+    return hashlib.sha256(f'{AI_MODEL}|{AI_TOPICS}|{normalized_title}'.encode('utf-8')).hexdigest()
+
+def classify_titles(titles):
+    results = [ai_cache.get(ai_cache_key(title)) for title in titles]
+    uncached_titles = [title for title, is_interesting in zip(titles, results) if is_interesting is None]
+    if uncached_titles:
+        try:
+            ai_results = are_interesting_titles(uncached_titles)
+        except Exception as e:
+            # The AI is down or rate limiting, one call per title would only fail the same way
+            logging.error(f"Error while checking titles with AI: {e}")
+            ai_results = [None] * len(uncached_titles)
+        if ai_results is None:
+            # Fall back to one call per title if the batch answer can't be parsed
+            ai_results = [is_interesting_title(title) for title in uncached_titles]
+        for title, is_interesting in zip(uncached_titles, ai_results):
+            # Failed checks aren't cached, so the title is asked again on the next fetch
+            if is_interesting is not None:
+                ai_cache.set(ai_cache_key(title), is_interesting, expire=AI_CACHE_EXPIRE)
+        ai_results = iter(ai_results)
+        results = [next(ai_results) if is_interesting is None else is_interesting for is_interesting in results]
+
+    # None marks a failed check, the caller leaves those entries for the next fetch
+    for title, is_interesting in zip(titles, results):
+        if is_interesting is not None:
+            logging.info(f"Parsed {title} to {'True' if is_interesting else 'False'}")
+    return results
+
+# Shared HTTP session: keeps connections alive between fetches and retries transient errors
+http_session = requests.Session()
+http_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504], allowed_methods={'GET'})
+)
+http_session.mount('https://', http_adapter)
+http_session.mount('http://', http_adapter)
+http_session.headers.update({'User-Agent': 'rss-sift/1.0', 'Accept-Encoding': 'gzip, deflate'})
+
+def fetch_html(url, etag=None, last_modified=None):
+    # Conditional GET: returns (status, content, etag, last_modified), content is None on 304.
+    # The body is returned as raw bytes (already gunzipped by the session) and decoded by the
+    # parser from the page's own charset, skipping requests' charset detection on response.text
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    try:
+        response = http_session.get(url, headers=headers, timeout=(5, 30))
+        if response.status_code == 304:
+            return 304, None, etag, last_modified
+        response.raise_for_status()  # Raise an error for bad status codes
+        return response.status_code, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified')
+    except requests.RequestException as e:
+        logging.error(f"Error fetching HTML from {url}: {e}")
+        return None, None, None, None
+
+def generate_hash(title, link, additional_info):
+    # Same digest as hashing the concatenated fields, without building the joined string
+    entry_hash = hashlib.sha256()
+    for value in (title, link, additional_info):
+        entry_hash.update(value.encode('utf-8'))
+    return entry_hash.hexdigest()
+
+
+# Hashes of the stored entries per feed, loaded from the database on first use and kept
+# up to date in-process, so quiet fetches only count the rows instead of reading every hash
+known_hashes_cache = {}
+known_hashes_lock = threading.Lock()
+
+def get_known_hashes(feed_name):
+    with known_hashes_lock:
+        # The web and scheduler processes both write, reload when the other one changed the feed
+        stored_count = Session.query(func.count(FeedData.id)).filter_by(feed_name=feed_name).scalar()
+        known_hashes = known_hashes_cache.get(feed_name)
+        if known_hashes is None or len(known_hashes) != stored_count:
+            known_hashes = known_hashes_cache[feed_name] = {h for (h,) in Session.query(FeedData.hash).filter_by(feed_name=feed_name)}
+        return known_hashes
+
+def forget_known_hashes(feed_name):
+    with known_hashes_lock:
+        known_hashes_cache.pop(feed_name, None)
+
+def parse_and_store_feed(feed_name, url_to_fetch, url_prefix):
+    logging.info(f"Fetching feed: {feed_name} from {url_to_fetch}")
+    feed_meta = Session.query(FeedMeta).filter_by(feed_name=feed_name).first()
+    if not feed_meta:
+        feed_meta = FeedMeta(feed_name=feed_name)
+        Session.add(feed_meta)
+
+    status, html_content, etag, last_modified = fetch_html(url_to_fetch, feed_meta.etag, feed_meta.last_modified)
+    if status == 304:
+        logging.info(f"Feed not modified since last fetch: {feed_name}")
+        feed_meta.last_fetched = datetime.now(timezone)
+        Session.commit()
+        return
+    if html_content is None:
+        logging.error(f"Failed to fetch feed: {feed_name}")
+        return
+    # Only build the tree for the listing rows, everything else on the page is ignored
+    soup = BeautifulSoup(html_content, 'lxml', parse_only=SoupStrainer('div', class_='row'))
+
+    published_year = str(config.get('published_year', 2024))
+    pending = []
+    known_hashes = get_known_hashes(feed_name)
+    page_hashes = set()
+    # One selector pass yields the articles that have both a title link and an info block
+    for article in soup.select(ARTICLE_SELECTOR):
+        title_tag = article.select_one(TITLE_SELECTOR)
+        title = title_tag.get_text(strip=True)
+        link = title_tag['href']
+
+        additional_info = article.select_one(INFO_SELECTOR).get_text(strip=True)
+        if not additional_info:
+            continue
+
+        entry_hash = generate_hash(title, link, additional_info)
+        if entry_hash in known_hashes or entry_hash in page_hashes:
+            continue
+
+        # Check the year is the configured one (2024 by default) and language is English
+        if published_year not in YEAR_PATTERN.findall(additional_info):
+            continue
+        if 'English' not in additional_info:
+            continue
+
+        logging.info(f"Processing: {title}")
+        page_hashes.add(entry_hash)
+        pending.append((title, link, additional_info, entry_hash))
+
+    # Hashes are unique across feeds: drop entries another feed already stored (same site listed
+    # on several pages), the per-feed set above only saves going to the database for known ones
+    if pending:
+        stored_hashes = {h for (h,) in Session.query(FeedData.hash).filter(FeedData.hash.in_([entry[3] for entry in pending]))}
+        pending = [entry for entry in pending if entry[3] not in stored_hashes]
+
+    # Titles the keyword filter can't decide go to the AI in batches, run concurrently
+    results = [keyword_verdict(entry[0]) for entry in pending]
+    ambiguous_titles = [entry[0] for entry, verdict in zip(pending, results) if verdict is None]
+    batch_size = config.get('ai_batch_size', 10)
+    batches = [ambiguous_titles[i:i + batch_size] for i in range(0, len(ambiguous_titles), batch_size)]
+    with ThreadPoolExecutor(max_workers=config.get('ai_workers', 8)) as executor:
+        ai_results = iter([ai_ok for batch in executor.map(classify_titles, batches) for ai_ok in batch])
+    results = [next(ai_results) if verdict is None else verdict for verdict in results]
+
+    new_rows = []
+    failed_checks = 0
+    for (title, link, additional_info, entry_hash), ai_ok in zip(pending, results):
+        if ai_ok is None:
+            # Not stored, so the entry is still new and gets checked again on the next fetch
+            logging.warning(f"AI check failed, retrying on next fetch: {title}")
+            failed_checks += 1
+            continue
+        if not ai_ok:
+            logging.info(f"Title not selected by AI: {title}")
+
+        new_rows.append({
+            'feed_name': feed_name,
+            'title': title,
+            'link': f'{url_prefix}{link}',
+            'additional_info': additional_info,
+            'hash': entry_hash,
+            'skip_ai': not ai_ok,
+            'created': datetime.now(timezone)
+        })
+
+    if new_rows:
+        Session.bulk_insert_mappings(FeedData, new_rows)
+
+    # Update last fetched time and the validators for the next conditional GET. Keep the old
+    # validators while checks are failing, else an unchanged page answers 304 and they're never retried
+    feed_meta.last_fetched = datetime.now(timezone)
+    if not failed_checks:
+        feed_meta.etag = etag
+        feed_meta.last_modified = last_modified
+
+    Session.commit()
+    with known_hashes_lock:
+        known_hashes.update(row['hash'] for row in new_rows)
+    logging.info(f"Completed fetching feed: {feed_name}")
+
+# Bounds how many feeds are fetched at once across all processes: the scheduler, the web UI and
+# fetch_all_feeds. Slots are leased, so a process that dies mid-fetch only holds one until it expires
+feed_fetch_slot_count = config.get('max_concurrent_feeds', config.get('fetch_workers', 4))
+feed_fetch_slot_lease = config.get('feed_fetch_lease', 1800)
+
+def acquire_feed_fetch_slot():
+    token = uuid.uuid4().hex
+    while True:
+        for i in range(feed_fetch_slot_count):
+            key = f'feed_fetch_slot:{i}'
+            if shared_state.add(key, token, expire=feed_fetch_slot_lease):
+                return key, token
+        time.sleep(1)
+
+def release_feed_fetch_slot(key, token):
+    # Only free the slot if the lease is still ours, it may have expired and been taken by another fetch
+    with shared_state.transact():
+        if shared_state.get(key) == token:
+            shared_state.delete(key)
+
+def fetch_feed_worker(feed):
+    # May run outside a request thread, so release the thread-local session when done
+    try:
+        slot = acquire_feed_fetch_slot()
+        try:
+            parse_and_store_feed(feed['name'], feed['url_to_fetch'], feed['url_prefix'])
+        finally:
+            release_feed_fetch_slot(*slot)
+    finally:
+        Session.remove()
+
+# Cached per feed and newest entry, so repeated polls don't rebuild an unchanged feed
+@lru_cache(maxsize=32)
+def generate_rss_feed(feed_name, latest_created):
+    fg = FeedGenerator()
+    fg.title(f'{feed_name} RSS Feed')
+    fg.link(href=f'http://{feed_name}.rss')
+    fg.description(f'This is the RSS feed for {feed_name}')
+    if latest_created:
+        # Build date follows the data, not the render time, so every render of the same entries is identical
+        fg.lastBuildDate(timezone.localize(datetime.fromisoformat(latest_created)))
+
+    feed_entries = Session.query(FeedData).filter_by(feed_name=feed_name, skip_ai=False).order_by(FeedData.created.desc()).limit(100).all()
+    for entry in feed_entries:
+        fe = fg.add_entry()
+        fe.title(entry.title)
+        fe.link(href=entry.link)
+        fe.description(entry.additional_info)
+        fe.guid(entry.link) 
+
+    rss_feed = fg.rss_str(pretty=True)
+    return rss_feed.decode('utf-8')
+
+# Single-flight: concurrent polls for the same feed wait for one render instead of each building it
+rss_inflight = {}
+rss_inflight_lock = threading.Lock()
+
+def generate_rss_feed_once(feed_name, latest_created):
+    key = (feed_name, latest_created)
+    with rss_inflight_lock:
+        future = rss_inflight.get(key)
+        owner = future is None
+        if owner:
+            future = rss_inflight[key] = Future()
+    if not owner:
+        return future.result()
+
+    try:
+        future.set_result(generate_rss_feed(feed_name, latest_created))
+    except Exception as e:
+        future.set_exception(e)
+    finally:
+        with rss_inflight_lock:
+            rss_inflight.pop(key, None)
+    return future.result()
+
+@app.route('/')
+def index():
+    feed_meta = Session.query(FeedMeta).all()
+    return render_template('index.html', feeds=feed_meta)
+
+@app.route('/<feed_name>/rss.xml')
+def rss_feed(feed_name):
+    try:
+        # SQLite hands back naive datetimes, stored in the configured timezone
+        latest_created = Session.query(func.max(FeedData.created)).filter_by(feed_name=feed_name, skip_ai=False).scalar()
+        latest_created_key = latest_created.replace(tzinfo=None).isoformat() if latest_created else ''
+        rss_feed = generate_rss_feed_once(feed_name, latest_created_key)
+        response = Response(rss_feed, mimetype='application/rss+xml')
+        # Derived from the cache key, so restarts and other gunicorn workers hand out the same ETag
+        response.set_etag(hashlib.md5(f'{feed_name}|{latest_created_key}'.encode('utf-8')).hexdigest())
+        if latest_created:
+            response.last_modified = timezone.localize(datetime.fromisoformat(latest_created_key))
+        return response.make_conditional(request)
+    except Exception as e:
+        logging.error(f"Error generating RSS feed for {feed_name}: {e}")
+        return str(e), 500
+
+@app.route('/fetch_all_feeds', methods=['POST'])
+def fetch_all_feeds():
+    try:
+        with ThreadPoolExecutor(max_workers=config.get('fetch_workers', 4)) as executor:
+            list(executor.map(fetch_feed_worker, config['feeds']))
+        return "All feeds fetched successfully", 200
+    except Exception as e:
+        logging.error(f"Error fetching all feeds: {e}")
+        return str(e), 500
+
+@app.route('/fetch_feed', methods=['POST'])
+def fetch_feed():
+    feed_name = request.form.get('feed_name')
+    feed = next((f for f in config['feeds'] if f['name'] == feed_name), None)
+    if not feed:
+        return "Feed not found", 404
+
+    try:
+        fetch_feed_worker(feed)
+        return redirect(url_for('index'))
+    except Exception as e:
+        logging.error(f"Error fetching feed {feed_name}: {e}")
+        return str(e), 500
+
+@app.route('/clean', methods=['POST'])
+def clean_feed():
+    feed_name = request.form.get('feed_name')
+    if not feed_name:
+        return "Feed name parameter is missing", 400
+
+    try:
+        Session.query(FeedData).filter_by(feed_name=feed_name).delete()
+        # Forget the cache validators so the next fetch downloads the full page again
+        Session.query(FeedMeta).filter_by(feed_name=feed_name).update({'etag': None, 'last_modified': None})
+        Session.commit()
+        forget_known_hashes(feed_name)
+        return redirect(url_for('index'))
+    except Exception as e:
+        logging.error(f"Error cleaning feed {feed_name}: {e}")
+        return str(e), 500
+
+def schedule_jobs(scheduler):
+    for feed in config['feeds']:
+        # Same fields as CronTrigger.from_crontab, which doesn't take a jitter
+        minute, hour, day, month, day_of_week = feed['cron'].split()
+        scheduler.add_job(
+            func=fetch_feed_worker,
+            trigger=CronTrigger(
+                minute=minute, hour=hour, day=day, month=month, day_of_week=day_of_week,
+                jitter=feed.get('jitter', 30)
+            ),
+            args=[feed],
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=300
+        )
+
+def scheduler_main():
+    # Runs in its own process, so slow fetches and AI calls don't hold up the web workers
+    scheduler = BlockingScheduler(
+        executors={'default': SchedulerThreadPoolExecutor(max_workers=config.get('scheduler_workers', 4))}
+    )
+    schedule_jobs(scheduler)
+    logging.info("Scheduler started")
+    scheduler.start()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the RSS feed generator.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help='Run the web application (use gunicorn rss_sift:app in production)')
+    serve_parser.add_argument('--host', type=str, default='localhost', help='Host to run the web application')
+    serve_parser.add_argument('--port', type=int, default=8080, help='Port to run the web application')
+
+    subparsers.add_parser('scheduler', help='Run the scheduler that fetches the feeds')
+
+    args = parser.parse_args()
+    if args.command == 'scheduler':
+        scheduler_main()
+    else:
+        serve(app, host=args.host, port=args.port)